@@ -14,12 +14,37 @@ Version: 1.0.0
 
 import argparse
 import boto3
+import logging
+from botocore.config import Config
 import sys
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of keys accepted by a single S3 DeleteObjects call
+S3_DELETE_BATCH_SIZE = 1000
+
+# Number of buckets emptied in parallel
+S3_BUCKET_WORKERS = 8
+
+# Concurrent delete_objects calls per bucket, and the cap on queued batches
+S3_DELETE_WORKERS = 16
+S3_MAX_BATCHES_IN_FLIGHT = 32
+
+# Page size for Glue get_jobs / get_crawlers listings
+GLUE_PAGE_SIZE = 200
+
+# Maximum number of tables accepted by a single Glue BatchDeleteTable call
+GLUE_TABLE_BATCH_SIZE = 100
+
+# Concurrent delete calls for orphaned log groups and buckets
+ORPHAN_DELETE_WORKERS = 16
+
+
 class Colors:
     """ANSI color codes"""
     HEADER = '\033[95m'
@@ -33,25 +58,42 @@ class Colors:
 
 
 def print_header(message: str):
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{message}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}\n")
+    logger.info(
+        f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}\n"
+        f"{Colors.HEADER}{Colors.BOLD}{message}{Colors.ENDC}\n"
+        f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}\n"
+    )
 
 
 def print_success(message: str):
-    print(f"{Colors.GREEN}✓ {message}{Colors.ENDC}")
+    logger.info(f"{Colors.GREEN}✓ {message}{Colors.ENDC}")
 
 
 def print_warning(message: str):
-    print(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
+    logger.warning(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
 
 
 def print_error(message: str):
-    print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
+    logger.error(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
 
 
 def print_info(message: str):
-    print(f"{Colors.CYAN}ℹ {message}{Colors.ENDC}")
+    logger.info(f"{Colors.CYAN}ℹ {message}{Colors.ENDC}")
+
+
+def configure_logging():
+    """Route cleanup output through a single stdout handler, dropping ANSI
+    colors when stdout is not a terminal"""
+    # Attach to this module's logger only so botocore's own INFO records
+    # (credential discovery etc.) stay quiet
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not sys.stdout.isatty():
+        for name in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'WARNING', 'FAIL', 'ENDC', 'BOLD'):
+            setattr(Colors, name, '')
 
 
 class ResourceCleaner:
@@ -63,23 +105,34 @@ class ResourceCleaner:
         self.dry_run = dry_run
         self.project_name = 'housing-market-intel'
         
-        # Initialize AWS clients
-        self.cfn = boto3.client('cloudformation', region_name=region)
-        self.s3 = boto3.client('s3', region_name=region)
-        self.s3_resource = boto3.resource('s3', region_name=region)
-        self.glue = boto3.client('glue', region_name=region)
-        self.opensearch = boto3.client('opensearch', region_name=region)
-        self.logs = boto3.client('logs', region_name=region)
+        # Initialize AWS clients from one session with a shared config: the
+        # thread pools below need a connection pool large enough to not
+        # serialize on checkout, and adaptive retries to absorb throttling
+        session = boto3.session.Session(region_name=region)
+        client_config = Config(
+            max_pool_connections=64,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+        self.cfn = session.client('cloudformation', config=client_config)
+        self.s3 = session.client('s3', config=client_config)
+        self.glue = session.client('glue', config=client_config)
+        self.opensearch = session.client('opensearch', config=client_config)
+        self.logs = session.client('logs', config=client_config)
         
         # Get account ID
-        sts = boto3.client('sts', region_name=region)
+        sts = session.client('sts', config=client_config)
         self.account_id = sts.get_caller_identity()['Account']
         
-        # Stack names
-        self.stack_names = [
-            f'{self.project_name}-{environment}-appflow',
-            f'{self.project_name}-{environment}-main'
+        # Stack names, grouped into deletion stages. Stacks in a stage are
+        # deleted concurrently; a stage starts only once the previous one is
+        # gone. The appflow flows use main's raw bucket, KMS key and IAM role,
+        # so appflow must be deleted before main.
+        self.stack_delete_stages = [
+            [f'{self.project_name}-{environment}-appflow'],
+            [f'{self.project_name}-{environment}-main']
         ]
+        self.stack_names = [name for stage in self.stack_delete_stages for name in stage]
         
         # Resources to clean
         self.cleanup_summary = {
@@ -93,20 +146,20 @@ class ResourceCleaner:
         """Execute full cleanup"""
         
         print_header("HOUSING MARKET INTELLIGENCE PLATFORM CLEANUP")
-        print(f"Environment: {self.environment}")
-        print(f"Region: {self.region}")
-        print(f"Account: {self.account_id}")
-        print(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
-        print(f"Timestamp: {datetime.utcnow().isoformat()}")
+        logger.info(f"Environment: {self.environment}")
+        logger.info(f"Region: {self.region}")
+        logger.info(f"Account: {self.account_id}")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
+        logger.info(f"Timestamp: {datetime.utcnow().isoformat()}")
         
         if not force and not self.dry_run:
-            print(f"\n{Colors.WARNING}WARNING: This will DELETE all resources in {self.environment}!{Colors.ENDC}")
-            print("This includes:")
-            print("  - CloudFormation stacks and all resources")
-            print("  - S3 buckets and all data")
-            print("  - OpenSearch domain and indexes")
-            print("  - Glue jobs, databases, and crawlers")
-            print("  - CloudWatch log groups")
+            logger.info(f"\n{Colors.WARNING}WARNING: This will DELETE all resources in {self.environment}!{Colors.ENDC}")
+            logger.info("This includes:")
+            logger.info("  - CloudFormation stacks and all resources")
+            logger.info("  - S3 buckets and all data")
+            logger.info("  - OpenSearch domain and indexes")
+            logger.info("  - Glue jobs, databases, and crawlers")
+            logger.info("  - CloudWatch log groups")
             
             confirm = input(f"\nType '{self.environment}' to confirm deletion: ")
             if confirm != self.environment:
@@ -145,18 +198,22 @@ class ResourceCleaner:
     def _discover_resources(self):
         """Discover resources to be cleaned up"""
         
+        # The lookups are independent, so issue them concurrently and report
+        # the results in a fixed order once they are all back
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            buckets = executor.submit(self._list_project_buckets)
+            log_groups = executor.submit(self._list_project_log_groups)
+            stack_statuses = executor.submit(self._get_stack_statuses)
+        
         # Find S3 buckets
         print_info("Discovering S3 buckets...")
         try:
-            response = self.s3.list_buckets()
-            prefix = f"{self.project_name}-{self.environment}"
-            self.buckets_to_delete = [
-                b['Name'] for b in response['Buckets']
-                if b['Name'].startswith(prefix)
-            ]
-            print(f"  Found {len(self.buckets_to_delete)} buckets to delete")
+            self.buckets_to_delete, other_region_buckets = buckets.result()
+            logger.info(f"  Found {len(self.buckets_to_delete)} buckets to delete")
             for bucket in self.buckets_to_delete:
-                print(f"    - {bucket}")
+                logger.info(f"    - {bucket}")
+            for bucket in other_region_buckets:
+                print_warning(f"  Skipping bucket outside {self.region}: {bucket}")
         except Exception as e:
             print_warning(f"Could not list buckets: {str(e)}")
             self.buckets_to_delete = []
@@ -164,58 +221,154 @@ class ResourceCleaner:
         # Find CloudWatch log groups
         print_info("Discovering CloudWatch log groups...")
         try:
-            paginator = self.logs.get_paginator('describe_log_groups')
-            self.log_groups_to_delete = []
-            
-            prefixes = [
-                f"/aws/glue/{self.project_name}",
-                f"/aws/lambda/{self.project_name}",
-                f"/aws/opensearch/{self.project_name}"
-            ]
-            
-            for prefix in prefixes:
-                for page in paginator.paginate(logGroupNamePrefix=prefix):
-                    for lg in page.get('logGroups', []):
-                        if self.environment in lg['logGroupName']:
-                            self.log_groups_to_delete.append(lg['logGroupName'])
-            
-            print(f"  Found {len(self.log_groups_to_delete)} log groups to delete")
+            self.log_groups_to_delete = log_groups.result()
+            logger.info(f"  Found {len(self.log_groups_to_delete)} log groups to delete")
         except Exception as e:
             print_warning(f"Could not list log groups: {str(e)}")
             self.log_groups_to_delete = []
         
         # Check stack status
         print_info("Checking CloudFormation stacks...")
+        self.existing_stacks = set()
+        for stack_name, status in stack_statuses.result().items():
+            logger.info(f"  {stack_name}: {status or 'NOT FOUND'}")
+            if status:
+                self.existing_stacks.add(stack_name)
+    
+    def _list_project_buckets(self) -> Tuple[List[str], List[str]]:
+        """List S3 buckets belonging to this environment, split into those in
+        this region and those elsewhere"""
+        response = self.s3.list_buckets()
+        prefix = f"{self.project_name}-{self.environment}"
+        candidates = [
+            b['Name'] for b in response['Buckets']
+            if b['Name'].startswith(prefix)
+        ]
+        
+        # Resolve each bucket's region once so later calls go straight to the
+        # regional endpoint instead of following a redirect every time
+        with ThreadPoolExecutor(max_workers=ORPHAN_DELETE_WORKERS) as executor:
+            regions = list(executor.map(self._get_bucket_region, candidates))
+        
+        in_region = [b for b, r in zip(candidates, regions) if r in (None, self.region)]
+        other_regions = [b for b, r in zip(candidates, regions) if r not in (None, self.region)]
+        return in_region, other_regions
+    
+    def _get_bucket_region(self, bucket_name: str) -> Optional[str]:
+        """Get a bucket's region (None if it could not be determined)"""
+        try:
+            response = self.s3.get_bucket_location(Bucket=bucket_name)
+        except Exception:
+            return None
+        # Buckets in us-east-1 report no location constraint, and the legacy
+        # 'EU' constraint means eu-west-1
+        location = response.get('LocationConstraint') or 'us-east-1'
+        return 'eu-west-1' if location == 'EU' else location
+    
+    def _list_project_log_groups(self) -> List[str]:
+        """List CloudWatch log groups belonging to this environment"""
+        prefixes = [
+            f"/aws/glue/{self.project_name}",
+            f"/aws/lambda/{self.project_name}",
+            f"/aws/opensearch/{self.project_name}"
+        ]
+        
+        # Each prefix is its own paginated sweep, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(prefixes)) as executor:
+            results = list(executor.map(self._list_log_groups_with_prefix, prefixes))
+        
+        return [lg for log_groups in results for lg in log_groups]
+    
+    def _list_log_groups_with_prefix(self, prefix: str) -> List[str]:
+        """List log groups under a prefix that belong to this environment"""
+        paginator = self.logs.get_paginator('describe_log_groups')
+        return [
+            lg['logGroupName']
+            for page in paginator.paginate(logGroupNamePrefix=prefix)
+            for lg in page.get('logGroups', [])
+            if self.environment in lg['logGroupName']
+        ]
+    
+    def _get_stack_statuses(self) -> Dict[str, Optional[str]]:
+        """Get the status of each project stack (None if not found)"""
+        statuses = {}
         for stack_name in self.stack_names:
             try:
                 response = self.cfn.describe_stacks(StackName=stack_name)
-                status = response['Stacks'][0]['StackStatus']
-                print(f"  {stack_name}: {status}")
+                statuses[stack_name] = response['Stacks'][0]['StackStatus']
             except self.cfn.exceptions.ClientError:
-                print(f"  {stack_name}: NOT FOUND")
+                statuses[stack_name] = None
+        return statuses
     
     def _empty_s3_buckets(self):
         """Empty S3 buckets to allow deletion"""
         
-        for bucket_name in self.buckets_to_delete:
-            print_info(f"Emptying bucket: {bucket_name}")
-            
-            if self.dry_run:
-                print(f"  [DRY RUN] Would empty bucket: {bucket_name}")
-                continue
+        if self.dry_run:
+            for bucket_name in self.buckets_to_delete:
+                print_info(f"Emptying bucket: {bucket_name}")
+                logger.info(f"  [DRY RUN] Would empty bucket: {bucket_name}")
+            return
+        
+        # Buckets are independent, so empty them concurrently
+        with ThreadPoolExecutor(max_workers=S3_BUCKET_WORKERS) as executor:
+            list(executor.map(self._empty_one_bucket, self.buckets_to_delete))
+    
+    def _empty_one_bucket(self, bucket_name: str):
+        """Delete every object version and delete marker in a bucket"""
+        print_info(f"Emptying bucket: {bucket_name}")
+        
+        try:
+            # Keep listing while earlier batches are still being deleted,
+            # bounding the number of batches in flight
+            failed_keys = 0
+            with ThreadPoolExecutor(max_workers=S3_DELETE_WORKERS) as executor:
+                in_flight = set()
+                paginator = self.s3.get_paginator('list_object_versions')
+                pages = paginator.paginate(
+                    Bucket=bucket_name,
+                    PaginationConfig={'PageSize': S3_DELETE_BATCH_SIZE}
+                )
+                for page in pages:
+                    objects = [
+                        {'Key': v['Key'], 'VersionId': v['VersionId']}
+                        for v in page.get('Versions', []) + page.get('DeleteMarkers', [])
+                    ]
+                    for i in range(0, len(objects), S3_DELETE_BATCH_SIZE):
+                        in_flight.add(executor.submit(
+                            self.s3.delete_objects,
+                            Bucket=bucket_name,
+                            Delete={'Objects': objects[i:i + S3_DELETE_BATCH_SIZE], 'Quiet': True}
+                        ))
+                    if len(in_flight) > S3_MAX_BATCHES_IN_FLIGHT:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        failed_keys += self._record_delete_errors(bucket_name, done)
+                failed_keys += self._record_delete_errors(bucket_name, wait(in_flight).done)
             
-            try:
-                bucket = self.s3_resource.Bucket(bucket_name)
-                
-                # Delete all object versions
-                bucket.object_versions.delete()
-                print_success(f"  Emptied bucket: {bucket_name}")
-                self.cleanup_summary['buckets_emptied'].append(bucket_name)
-                
-            except Exception as e:
-                error_msg = f"Could not empty bucket {bucket_name}: {str(e)}"
+            if failed_keys:
+                # The bucket still holds objects, so its deletion would fail
+                error_msg = f"Could not empty bucket {bucket_name}: {failed_keys} object(s) failed to delete"
                 print_error(f"  {error_msg}")
                 self.cleanup_summary['errors'].append(error_msg)
+            else:
+                print_success(f"  Emptied bucket: {bucket_name}")
+                self.cleanup_summary['buckets_emptied'].append(bucket_name)
+            
+        except Exception as e:
+            error_msg = f"Could not empty bucket {bucket_name}: {str(e)}"
+            print_error(f"  {error_msg}")
+            self.cleanup_summary['errors'].append(error_msg)
+    
+    def _record_delete_errors(self, bucket_name: str, futures) -> int:
+        """Record per-key failures from completed delete_objects calls and
+        return how many keys failed"""
+        failed_keys = 0
+        for future in futures:
+            for error in future.result().get('Errors', []):
+                self.cleanup_summary['errors'].append(
+                    f"Could not delete s3://{bucket_name}/{error['Key']}: {error.get('Message', error.get('Code'))}"
+                )
+                failed_keys += 1
+        return failed_keys
     
     def _cleanup_glue_resources(self):
         """Clean up Glue resources"""
@@ -226,34 +379,44 @@ class ResourceCleaner:
         # Delete Glue jobs
         print_info("Deleting Glue jobs...")
         try:
-            response = self.glue.get_jobs()
-            for job in response.get('Jobs', []):
-                if job['Name'].startswith(job_prefix):
-                    if self.dry_run:
-                        print(f"  [DRY RUN] Would delete job: {job['Name']}")
-                    else:
-                        self.glue.delete_job(JobName=job['Name'])
-                        print_success(f"  Deleted job: {job['Name']}")
+            paginator = self.glue.get_paginator('get_jobs')
+            job_names = [
+                job['Name']
+                for page in paginator.paginate(PaginationConfig={'PageSize': GLUE_PAGE_SIZE})
+                for job in page.get('Jobs', [])
+                if job['Name'].startswith(job_prefix)
+            ]
+            for job_name in job_names:
+                if self.dry_run:
+                    logger.info(f"  [DRY RUN] Would delete job: {job_name}")
+                else:
+                    self.glue.delete_job(JobName=job_name)
+                    print_success(f"  Deleted job: {job_name}")
         except Exception as e:
             print_warning(f"Could not clean Glue jobs: {str(e)}")
         
         # Delete Glue crawlers
         print_info("Deleting Glue crawlers...")
         try:
-            response = self.glue.get_crawlers()
-            for crawler in response.get('Crawlers', []):
-                if crawler['Name'].startswith(job_prefix):
-                    if self.dry_run:
-                        print(f"  [DRY RUN] Would delete crawler: {crawler['Name']}")
-                    else:
-                        # Stop crawler if running
-                        try:
-                            self.glue.stop_crawler(Name=crawler['Name'])
-                            time.sleep(5)
-                        except:
-                            pass
-                        self.glue.delete_crawler(Name=crawler['Name'])
-                        print_success(f"  Deleted crawler: {crawler['Name']}")
+            paginator = self.glue.get_paginator('get_crawlers')
+            crawler_names = [
+                crawler['Name']
+                for page in paginator.paginate(PaginationConfig={'PageSize': GLUE_PAGE_SIZE})
+                for crawler in page.get('Crawlers', [])
+                if crawler['Name'].startswith(job_prefix)
+            ]
+            for crawler_name in crawler_names:
+                if self.dry_run:
+                    logger.info(f"  [DRY RUN] Would delete crawler: {crawler_name}")
+                else:
+                    # Stop crawler if running
+                    try:
+                        self.glue.stop_crawler(Name=crawler_name)
+                        time.sleep(5)
+                    except:
+                        pass
+                    self.glue.delete_crawler(Name=crawler_name)
+                    print_success(f"  Deleted crawler: {crawler_name}")
         except Exception as e:
             print_warning(f"Could not clean Glue crawlers: {str(e)}")
         
@@ -261,16 +424,24 @@ class ResourceCleaner:
         print_info(f"Deleting Glue database: {db_name}")
         try:
             if self.dry_run:
-                print(f"  [DRY RUN] Would delete database: {db_name}")
+                logger.info(f"  [DRY RUN] Would delete database: {db_name}")
             else:
                 # First delete all tables
                 try:
-                    tables = self.glue.get_tables(DatabaseName=db_name)
-                    for table in tables.get('TableList', []):
-                        self.glue.delete_table(
+                    table_names = []
+                    paginator = self.glue.get_paginator('get_tables')
+                    for page in paginator.paginate(DatabaseName=db_name):
+                        table_names.extend(t['Name'] for t in page.get('TableList', []))
+                    for i in range(0, len(table_names), GLUE_TABLE_BATCH_SIZE):
+                        response = self.glue.batch_delete_table(
                             DatabaseName=db_name,
-                            Name=table['Name']
+                            TablesToDelete=table_names[i:i + GLUE_TABLE_BATCH_SIZE]
                         )
+                        for error in response.get('Errors', []):
+                            self.cleanup_summary['errors'].append(
+                                f"Could not delete table {db_name}.{error['TableName']}: "
+                                f"{error.get('ErrorDetail', {}).get('ErrorMessage', '')}"
+                            )
                 except:
                     pass
                 
@@ -282,99 +453,147 @@ class ResourceCleaner:
             print_warning(f"Could not delete database: {str(e)}")
     
     def _delete_stacks(self):
-        """Delete CloudFormation stacks"""
+        """Delete CloudFormation stacks, stage by stage"""
         
-        for stack_name in self.stack_names:
+        for index, stage in enumerate(self.stack_delete_stages):
+            if not self._delete_stack_stage(stage):
+                # Later stages own resources the failed stacks still use
+                for stage_left in self.stack_delete_stages[index + 1:]:
+                    for stack_name in stage_left:
+                        error_msg = f"Skipped deleting stack {stack_name}: stacks depending on it were not deleted"
+                        print_error(f"  {error_msg}")
+                        self.cleanup_summary['errors'].append(error_msg)
+                return
+    
+    def _delete_stack_stage(self, stage: List[str]) -> bool:
+        """Delete a stage of independent stacks concurrently; returns whether
+        all of them are gone"""
+        
+        success = True
+        stacks_deleting = []
+        for stack_name in stage:
             print_info(f"Deleting stack: {stack_name}")
             
             if self.dry_run:
-                print(f"  [DRY RUN] Would delete stack: {stack_name}")
+                logger.info(f"  [DRY RUN] Would delete stack: {stack_name}")
+                continue
+            
+            # Existence was already checked during discovery
+            if stack_name not in self.existing_stacks:
+                print_info(f"  Stack not found: {stack_name}")
                 continue
             
             try:
-                # Check if stack exists
-                try:
-                    self.cfn.describe_stacks(StackName=stack_name)
-                except self.cfn.exceptions.ClientError:
-                    print_info(f"  Stack not found: {stack_name}")
-                    continue
-                
-                # Delete stack
                 self.cfn.delete_stack(StackName=stack_name)
-                
-                # Wait for deletion
-                print_info(f"  Waiting for stack deletion: {stack_name}")
-                waiter = self.cfn.get_waiter('stack_delete_complete')
-                waiter.wait(
-                    StackName=stack_name,
-                    WaiterConfig={'Delay': 30, 'MaxAttempts': 60}
-                )
-                
-                print_success(f"  Deleted stack: {stack_name}")
-                self.cleanup_summary['stacks_deleted'].append(stack_name)
+                stacks_deleting.append(stack_name)
                 
             except Exception as e:
                 error_msg = f"Could not delete stack {stack_name}: {str(e)}"
                 print_error(f"  {error_msg}")
                 self.cleanup_summary['errors'].append(error_msg)
+                success = False
+        
+        if not stacks_deleting:
+            return success
+        
+        # Wait for the stage's deletions at once so their delete windows overlap
+        with ThreadPoolExecutor(max_workers=len(stacks_deleting)) as executor:
+            futures = {}
+            for stack_name in stacks_deleting:
+                print_info(f"  Waiting for stack deletion: {stack_name}")
+                futures[executor.submit(self._wait_for_stack_delete, stack_name)] = stack_name
+            
+            for future in as_completed(futures):
+                stack_name = futures[future]
+                try:
+                    future.result()
+                    print_success(f"  Deleted stack: {stack_name}")
+                    self.cleanup_summary['stacks_deleted'].append(stack_name)
+                except Exception as e:
+                    error_msg = f"Could not delete stack {stack_name}: {str(e)}"
+                    print_error(f"  {error_msg}")
+                    self.cleanup_summary['errors'].append(error_msg)
+                    success = False
+        
+        return success
+    
+    def _wait_for_stack_delete(self, stack_name: str):
+        """Block until a stack reaches DELETE_COMPLETE (polls every 10s, 30 min cap)"""
+        waiter = self.cfn.get_waiter('stack_delete_complete')
+        waiter.wait(
+            StackName=stack_name,
+            WaiterConfig={'Delay': 10, 'MaxAttempts': 180}
+        )
     
     def _cleanup_orphaned_resources(self):
         """Clean up any orphaned resources"""
         
         # Delete CloudWatch log groups
         print_info("Deleting CloudWatch log groups...")
-        for log_group in self.log_groups_to_delete:
-            if self.dry_run:
-                print(f"  [DRY RUN] Would delete log group: {log_group}")
-            else:
-                try:
-                    self.logs.delete_log_group(logGroupName=log_group)
-                    print_success(f"  Deleted log group: {log_group}")
-                    self.cleanup_summary['log_groups_deleted'].append(log_group)
-                except Exception as e:
-                    print_warning(f"  Could not delete log group {log_group}: {str(e)}")
+        if self.dry_run:
+            for log_group in self.log_groups_to_delete:
+                logger.info(f"  [DRY RUN] Would delete log group: {log_group}")
+        else:
+            with ThreadPoolExecutor(max_workers=ORPHAN_DELETE_WORKERS) as executor:
+                list(executor.map(self._delete_log_group, self.log_groups_to_delete))
         
         # Delete orphaned S3 buckets (those not deleted by CFN)
         print_info("Cleaning orphaned S3 buckets...")
-        for bucket_name in self.buckets_to_delete:
-            if self.dry_run:
-                print(f"  [DRY RUN] Would delete bucket: {bucket_name}")
-            else:
-                try:
-                    self.s3.delete_bucket(Bucket=bucket_name)
-                    print_success(f"  Deleted bucket: {bucket_name}")
-                except self.s3.exceptions.NoSuchBucket:
-                    print_info(f"  Bucket already deleted: {bucket_name}")
-                except Exception as e:
-                    print_warning(f"  Could not delete bucket {bucket_name}: {str(e)}")
+        if self.dry_run:
+            for bucket_name in self.buckets_to_delete:
+                logger.info(f"  [DRY RUN] Would delete bucket: {bucket_name}")
+        else:
+            with ThreadPoolExecutor(max_workers=ORPHAN_DELETE_WORKERS) as executor:
+                list(executor.map(self._delete_bucket, self.buckets_to_delete))
+    
+    def _delete_log_group(self, log_group: str):
+        """Delete a single CloudWatch log group"""
+        try:
+            self.logs.delete_log_group(logGroupName=log_group)
+            print_success(f"  Deleted log group: {log_group}")
+            self.cleanup_summary['log_groups_deleted'].append(log_group)
+        except self.logs.exceptions.ResourceNotFoundException:
+            print_info(f"  Log group already deleted: {log_group}")
+        except Exception as e:
+            print_warning(f"  Could not delete log group {log_group}: {str(e)}")
+    
+    def _delete_bucket(self, bucket_name: str):
+        """Delete a single (already emptied) S3 bucket"""
+        try:
+            self.s3.delete_bucket(Bucket=bucket_name)
+            print_success(f"  Deleted bucket: {bucket_name}")
+        except self.s3.exceptions.NoSuchBucket:
+            print_info(f"  Bucket already deleted: {bucket_name}")
+        except Exception as e:
+            print_warning(f"  Could not delete bucket {bucket_name}: {str(e)}")
     
     def _print_summary(self):
         """Print cleanup summary"""
         
-        print(f"\n{Colors.BOLD}Cleanup Results:{Colors.ENDC}")
-        print("-" * 40)
+        logger.info(f"\n{Colors.BOLD}Cleanup Results:{Colors.ENDC}")
+        logger.info("-" * 40)
         
-        print(f"\nStacks Deleted ({len(self.cleanup_summary['stacks_deleted'])}):")
+        logger.info(f"\nStacks Deleted ({len(self.cleanup_summary['stacks_deleted'])}):")
         for stack in self.cleanup_summary['stacks_deleted']:
-            print(f"  ✓ {stack}")
+            logger.info(f"  ✓ {stack}")
         
-        print(f"\nBuckets Emptied ({len(self.cleanup_summary['buckets_emptied'])}):")
+        logger.info(f"\nBuckets Emptied ({len(self.cleanup_summary['buckets_emptied'])}):")
         for bucket in self.cleanup_summary['buckets_emptied']:
-            print(f"  ✓ {bucket}")
+            logger.info(f"  ✓ {bucket}")
         
-        print(f"\nLog Groups Deleted ({len(self.cleanup_summary['log_groups_deleted'])}):")
+        logger.info(f"\nLog Groups Deleted ({len(self.cleanup_summary['log_groups_deleted'])}):")
         for lg in self.cleanup_summary['log_groups_deleted']:
-            print(f"  ✓ {lg}")
+            logger.info(f"  ✓ {lg}")
         
         if self.cleanup_summary['errors']:
-            print(f"\n{Colors.FAIL}Errors ({len(self.cleanup_summary['errors'])}):{Colors.ENDC}")
+            logger.info(f"\n{Colors.FAIL}Errors ({len(self.cleanup_summary['errors'])}):{Colors.ENDC}")
             for error in self.cleanup_summary['errors']:
-                print(f"  ✗ {error}")
+                logger.info(f"  ✗ {error}")
         
         if self.dry_run:
-            print(f"\n{Colors.WARNING}This was a DRY RUN - no resources were actually deleted{Colors.ENDC}")
+            logger.info(f"\n{Colors.WARNING}This was a DRY RUN - no resources were actually deleted{Colors.ENDC}")
         else:
-            print(f"\n{Colors.GREEN}Cleanup complete!{Colors.ENDC}")
+            logger.info(f"\n{Colors.GREEN}Cleanup complete!{Colors.ENDC}")
 
 
 def main():
@@ -405,6 +624,8 @@ def main():
     
     args = parser.parse_args()
     
+    configure_logging()
+    
     cleaner = ResourceCleaner(
         environment=args.environment,
         region=args.region,
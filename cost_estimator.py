@@ -10,10 +10,17 @@ Author: Housing Market Intelligence Platform
 Version: 1.0.0
 """
 
-import argparse
+import functools
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+
+class Environment(IntEnum):
+    DEV = 0
+    STAGING = 1
+    PROD = 2
 
 
 class DataVolume(Enum):
@@ -22,7 +29,153 @@ class DataVolume(Enum):
     HIGH = "high"  # ~10M records/month
 
 
-@dataclass
+@dataclass(frozen=True)
+class VolumeProfile:
+    """Workload assumptions for a data volume tier"""
+    records_per_month: int
+    glue_dpu_hours: int
+    embedding_requests: int
+    rag_queries_per_day: int
+    storage_gb: int
+
+
+# Data volume configurations
+VOLUME_PROFILES: Dict[DataVolume, VolumeProfile] = {
+    DataVolume.LOW: VolumeProfile(
+        records_per_month=100_000,
+        glue_dpu_hours=10,
+        embedding_requests=100_000,
+        rag_queries_per_day=100,
+        storage_gb=10
+    ),
+    DataVolume.MEDIUM: VolumeProfile(
+        records_per_month=1_000_000,
+        glue_dpu_hours=50,
+        embedding_requests=1_000_000,
+        rag_queries_per_day=1_000,
+        storage_gb=100
+    ),
+    DataVolume.HIGH: VolumeProfile(
+        records_per_month=10_000_000,
+        glue_dpu_hours=200,
+        embedding_requests=10_000_000,
+        rag_queries_per_day=10_000,
+        storage_gb=1000
+    )
+}
+
+# Billing month used to derive hourly and daily figures (720 hours, 30 days)
+_INV_HOURS_PER_MONTH = 1.0 / 720
+_INV_DAYS_PER_MONTH = 1.0 / 30
+
+# Report layout shared by the table, total and category rows
+_SEP = "=" * 80
+_DIV = "-" * 80
+_SUBDIV = "-" * 40
+_TABLE_HEADER = f"{'Service':<25} {'Hourly':>12} {'Daily':>12} {'Monthly':>12}"
+_ROW = "{name:<25} ${hourly:>10.4f} ${daily:>10.2f} ${monthly:>10.2f}".format
+_CATEGORY_ROW = "{category:<20} ${cost:>10.2f} ({percentage:>5.1f}%)".format
+
+# Cost breakdown categories, in report order, and the reverse service lookup
+_COST_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    'Compute': ('glue', 'lambda', 'opensearch'),
+    'AI/ML': ('bedrock',),
+    'Storage': ('s3',),
+    'Networking': ('nat_gateway', 'vpc'),
+    'Integration': ('appflow', 'api_gateway'),
+    'Security': ('kms', 'secrets_manager'),
+    'Monitoring': ('cloudwatch',)
+}
+_CATEGORY_OF: Dict[str, str] = {
+    service: category
+    for category, services in _COST_CATEGORIES.items()
+    for service in services
+}
+
+# Environment-specific multipliers, indexed by Environment
+ENV_MULTIPLIERS: Tuple[float, ...] = (1.0, 1.5, 3.0)
+
+
+# Cost kernels for the usage-driven services. They are plain module-level
+# functions of their workload inputs so sweeps can evaluate them directly,
+# without building a CostEstimator per scenario.
+
+def _glue_components(dpu_hours: float) -> Tuple[float, float]:
+    """Monthly Glue (ETL jobs, crawlers) cost"""
+    dpu_hour_cost = 0.44  # $0.44 per DPU-hour
+    crawler_dpu_hour_cost = 0.44
+    crawler_hours = 2  # Estimate 2 DPU-hours per day for crawlers
+
+    monthly_etl = dpu_hours * dpu_hour_cost
+    monthly_crawler = crawler_hours * 30 * crawler_dpu_hour_cost
+    return monthly_etl, monthly_crawler
+
+
+def _lambda_components(
+    rag_queries_per_day: float,
+    avg_duration_ms: float = 2000,
+    memory_mb: float = 1024
+) -> Tuple[float, float]:
+    """Monthly Lambda (compute, requests) cost"""
+    requests_per_month = rag_queries_per_day * 30
+
+    # Compute cost
+    gb_seconds = (requests_per_month * avg_duration_ms / 1000) * (memory_mb / 1024)
+    compute_cost = gb_seconds * 0.0000166667
+
+    # Request cost
+    request_cost = (requests_per_month / 1_000_000) * 0.20
+
+    return compute_cost, request_cost
+
+
+def _bedrock_components(
+    embedding_requests: float,
+    rag_queries_per_day: float,
+    input_tokens_per_query: float = 3000,
+    output_tokens_per_query: float = 500
+) -> Tuple[float, float, float]:
+    """Monthly Bedrock (embeddings, Claude input, Claude output) cost"""
+    # Embedding costs (Titan)
+    embedding_tokens = embedding_requests * 500  # avg 500 tokens per doc
+    embedding_cost = (embedding_tokens / 1000) * 0.0001  # $0.0001 per 1K tokens
+
+    # Claude generation costs
+    queries_per_month = rag_queries_per_day * 30
+    input_tokens = queries_per_month * input_tokens_per_query  # context + query
+    output_tokens = queries_per_month * output_tokens_per_query  # response
+
+    # Claude 3 Sonnet pricing
+    input_cost = (input_tokens / 1000) * 0.003  # $3 per 1M input
+    output_cost = (output_tokens / 1000) * 0.015  # $15 per 1M output
+
+    return embedding_cost, input_cost, output_cost
+
+
+def scenarios(
+    glue_dpu_hours: Sequence[float],
+    embedding_requests: Sequence[float],
+    rag_queries_per_day: Sequence[float],
+    input_tokens_per_query: float = 3000,
+    output_tokens_per_query: float = 500
+) -> List[Tuple[float, float, float]]:
+    """
+    Monthly (bedrock, glue, lambda) cost for each scenario
+
+    The workload sequences are read element-wise, one scenario per index,
+    which makes this suitable for Monte-Carlo runs over usage assumptions.
+    """
+    return [
+        (
+            sum(_bedrock_components(embeddings, queries, input_tokens_per_query, output_tokens_per_query)),
+            sum(_glue_components(dpu_hours)),
+            sum(_lambda_components(queries))
+        )
+        for dpu_hours, embeddings, queries in zip(glue_dpu_hours, embedding_requests, rag_queries_per_day)
+    ]
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceCost:
     """Represents cost for a single AWS service"""
     service_name: str
@@ -30,9 +183,35 @@ class ServiceCost:
     hourly_cost: float
     daily_cost: float
     monthly_cost: float
-    cost_components: Dict[str, float]
+    cost_components: Mapping[str, float]
     notes: str = ""
 
+    def __post_init__(self):
+        # Instances are shared through the cost cache, so the component
+        # breakdown must be read-only as well
+        if not isinstance(self.cost_components, MappingProxyType):
+            object.__setattr__(self, 'cost_components', MappingProxyType(dict(self.cost_components)))
+
+    @classmethod
+    def from_monthly(
+        cls,
+        service_name: str,
+        description: str,
+        monthly: float,
+        cost_components: Mapping[str, float],
+        notes: str = ""
+    ) -> 'ServiceCost':
+        """Build a ServiceCost from its monthly total, deriving hourly and daily"""
+        return cls(
+            service_name=service_name,
+            description=description,
+            hourly_cost=monthly * _INV_HOURS_PER_MONTH,
+            daily_cost=monthly * _INV_DAYS_PER_MONTH,
+            monthly_cost=monthly,
+            cost_components=cost_components,
+            notes=notes
+        )
+
 
 class CostEstimator:
     """
@@ -42,44 +221,21 @@ class CostEstimator:
     Actual costs may vary based on region and usage patterns
     """
 
-    def __init__(self, environment: str, data_volume: DataVolume = DataVolume.MEDIUM):
+    def __init__(self, environment: Union[str, Environment], data_volume: DataVolume = DataVolume.MEDIUM):
+        if not isinstance(environment, Environment):
+            environment = Environment[environment.upper()]
         self.environment = environment
         self.data_volume = data_volume
 
-        # Environment-specific multipliers
-        self.env_multipliers = {
-            'dev': 1.0,
-            'staging': 1.5,
-            'prod': 3.0
-        }
-
-        # Data volume configurations
-        self.volume_config = {
-            DataVolume.LOW: {
-                'records_per_month': 100_000,
-                'glue_dpu_hours': 10,
-                'embedding_requests': 100_000,
-                'rag_queries_per_day': 100,
-                'storage_gb': 10
-            },
-            DataVolume.MEDIUM: {
-                'records_per_month': 1_000_000,
-                'glue_dpu_hours': 50,
-                'embedding_requests': 1_000_000,
-                'rag_queries_per_day': 1_000,
-                'storage_gb': 100
-            },
-            DataVolume.HIGH: {
-                'records_per_month': 10_000_000,
-                'glue_dpu_hours': 200,
-                'embedding_requests': 10_000_000,
-                'rag_queries_per_day': 10_000,
-                'storage_gb': 1000
-            }
-        }
+        # Resolve the volume profile once; the calculators read it directly
+        self.volume = VOLUME_PROFILES[data_volume]
 
     def calculate_all_costs(self) -> Dict[str, ServiceCost]:
         """Calculate costs for all services"""
+        return dict(_cached_costs(self.environment, self.data_volume))
+
+    def _calculate_services(self) -> Dict[str, ServiceCost]:
+        """Run every service calculator (uncached)"""
         return {
             'vpc': self._calculate_vpc_costs(),
             'nat_gateway': self._calculate_nat_gateway_costs(),
@@ -95,14 +251,30 @@ class CostEstimator:
             'secrets_manager': self._calculate_secrets_manager_costs()
         }
 
+    @classmethod
+    def calculate_grid(
+        cls,
+        environments: Iterable[Union[str, Environment]],
+        data_volumes: Iterable[DataVolume]
+    ) -> Dict[Tuple[Environment, DataVolume], Dict[str, ServiceCost]]:
+        """Calculate costs for every (environment, data volume) scenario"""
+        data_volumes = list(data_volumes)
+        estimators = [
+            cls(environment, data_volume)
+            for environment in environments
+            for data_volume in data_volumes
+        ]
+        return {
+            (estimator.environment, estimator.data_volume): estimator.calculate_all_costs()
+            for estimator in estimators
+        }
+
     def _calculate_vpc_costs(self) -> ServiceCost:
         """VPC itself is free, but NAT Gateway is not"""
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon VPC",
             description="Virtual Private Cloud networking",
-            hourly_cost=0.0,
-            daily_cost=0.0,
-            monthly_cost=0.0,
+            monthly=0.0,
             cost_components={
                 'vpc': 0.0,
                 'subnets': 0.0,
@@ -122,17 +294,15 @@ class CostEstimator:
         daily = hourly * 24
         monthly = daily * 30
 
-        multiplier = self.env_multipliers[self.environment]
-        if self.environment == 'prod':
+        multiplier = ENV_MULTIPLIERS[self.environment]
+        if self.environment is Environment.PROD:
             # Production might have 2 NAT gateways for HA
             multiplier = 2.0
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="NAT Gateway",
             description="Network Address Translation for private subnets",
-            hourly_cost=hourly * multiplier,
-            daily_cost=daily * multiplier,
-            monthly_cost=monthly * multiplier,
+            monthly=monthly * multiplier,
             cost_components={
                 'hourly_charge': 0.045 * multiplier,
                 'data_processing': data_processed_per_hour_gb * data_rate * multiplier
@@ -142,25 +312,22 @@ class CostEstimator:
 
     def _calculate_s3_costs(self) -> ServiceCost:
         """S3 storage and request costs"""
-        config = self.volume_config[self.data_volume]
-        storage_gb = config['storage_gb']
+        storage_gb = self.volume.storage_gb
 
         # S3 Standard pricing
         storage_cost_per_gb = 0.023  # First 50TB
-        put_requests = config['records_per_month'] * 2  # Writes
-        get_requests = config['records_per_month'] * 5  # Reads
+        put_requests = self.volume.records_per_month * 2  # Writes
+        get_requests = self.volume.records_per_month * 5  # Reads
 
         put_cost = (put_requests / 1000) * 0.005  # $0.005 per 1000 PUT
         get_cost = (get_requests / 1000) * 0.0004  # $0.0004 per 1000 GET
 
         monthly = (storage_gb * storage_cost_per_gb) + put_cost + get_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon S3",
             description="Object storage for raw and processed data",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'storage': storage_gb * storage_cost_per_gb,
                 'put_requests': put_cost,
@@ -171,23 +338,19 @@ class CostEstimator:
 
     def _calculate_kms_costs(self) -> ServiceCost:
         """KMS key and request costs"""
-        config = self.volume_config[self.data_volume]
-
         key_cost = 1.0  # $1/month per key
         num_keys = 1
 
         # Cryptographic requests
-        requests = config['records_per_month'] * 3  # encrypt/decrypt operations
+        requests = self.volume.records_per_month * 3  # encrypt/decrypt operations
         request_cost = (requests / 10000) * 0.03  # $0.03 per 10,000 requests
 
         monthly = (key_cost * num_keys) + request_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="AWS KMS",
             description="Key Management Service for encryption",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'key_storage': key_cost * num_keys,
                 'requests': request_cost
@@ -197,29 +360,17 @@ class CostEstimator:
 
     def _calculate_glue_costs(self) -> ServiceCost:
         """AWS Glue costs for ETL"""
-        config = self.volume_config[self.data_volume]
-
-        # Glue ETL job costs
-        dpu_hour_cost = 0.44  # $0.44 per DPU-hour
-        dpu_hours = config['glue_dpu_hours']
-
-        # Crawler costs
-        crawler_dpu_hour_cost = 0.44
-        crawler_hours = 2  # Estimate 2 DPU-hours per day for crawlers
+        dpu_hours = self.volume.glue_dpu_hours
+        monthly_etl, monthly_crawler = _glue_components(dpu_hours)
+        monthly = monthly_etl + monthly_crawler
 
         # Data Catalog
         catalog_storage = 0.0  # First 1M objects free
 
-        monthly_etl = dpu_hours * dpu_hour_cost
-        monthly_crawler = crawler_hours * 30 * crawler_dpu_hour_cost
-        monthly = monthly_etl + monthly_crawler
-
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="AWS Glue",
             description="ETL jobs and data catalog",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'etl_jobs': monthly_etl,
                 'crawlers': monthly_crawler,
@@ -230,24 +381,20 @@ class CostEstimator:
 
     def _calculate_appflow_costs(self) -> ServiceCost:
         """Amazon AppFlow costs"""
-        config = self.volume_config[self.data_volume]
-
         # Flow run costs
         flow_run_cost = 0.001  # $0.001 per flow run
         runs_per_month = 30 * 24  # Hourly runs
 
         # Data processing
-        gb_processed = config['storage_gb'] / 10  # Estimate GB per month
+        gb_processed = self.volume.storage_gb / 10  # Estimate GB per month
         processing_cost = gb_processed * 0.02  # $0.02 per GB
 
         monthly = (flow_run_cost * runs_per_month) + processing_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon AppFlow",
             description="SaaS data integration",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'flow_runs': flow_run_cost * runs_per_month,
                 'data_processing': processing_cost
@@ -259,9 +406,9 @@ class CostEstimator:
         """Amazon OpenSearch costs"""
         # Instance pricing varies by environment
         instance_configs = {
-            'dev': {'type': 't3.small.search', 'hourly': 0.036, 'count': 1},
-            'staging': {'type': 't3.medium.search', 'hourly': 0.073, 'count': 2},
-            'prod': {'type': 'r6g.large.search', 'hourly': 0.167, 'count': 3}
+            Environment.DEV: {'type': 't3.small.search', 'hourly': 0.036, 'count': 1},
+            Environment.STAGING: {'type': 't3.medium.search', 'hourly': 0.073, 'count': 2},
+            Environment.PROD: {'type': 'r6g.large.search', 'hourly': 0.167, 'count': 3}
         }
 
         config = instance_configs[self.environment]
@@ -270,17 +417,15 @@ class CostEstimator:
         instance_monthly = config['hourly'] * 720 * config['count']
 
         # EBS storage
-        storage_gb = self.volume_config[self.data_volume]['storage_gb']
+        storage_gb = self.volume.storage_gb
         ebs_cost = storage_gb * 0.135  # gp3 pricing
 
         monthly = instance_monthly + ebs_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon OpenSearch",
             description="Vector database for semantic search",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'instances': instance_monthly,
                 'ebs_storage': ebs_cost
@@ -290,28 +435,18 @@ class CostEstimator:
 
     def _calculate_lambda_costs(self) -> ServiceCost:
         """AWS Lambda costs"""
-        config = self.volume_config[self.data_volume]
-
-        # Lambda pricing
-        requests_per_month = config['rag_queries_per_day'] * 30
+        requests_per_month = self.volume.rag_queries_per_day * 30
         avg_duration_ms = 2000  # 2 second average
-        memory_mb = 1024
-
-        # Compute cost
-        gb_seconds = (requests_per_month * avg_duration_ms / 1000) * (memory_mb / 1024)
-        compute_cost = gb_seconds * 0.0000166667
-
-        # Request cost
-        request_cost = (requests_per_month / 1_000_000) * 0.20
 
+        compute_cost, request_cost = _lambda_components(
+            self.volume.rag_queries_per_day, avg_duration_ms=avg_duration_ms
+        )
         monthly = compute_cost + request_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="AWS Lambda",
             description="Serverless compute for RAG queries",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'compute': compute_cost,
                 'requests': request_cost
@@ -321,19 +456,15 @@ class CostEstimator:
 
     def _calculate_api_gateway_costs(self) -> ServiceCost:
         """API Gateway costs"""
-        config = self.volume_config[self.data_volume]
-
-        requests_per_month = config['rag_queries_per_day'] * 30
+        requests_per_month = self.volume.rag_queries_per_day * 30
 
         # REST API pricing
         api_cost = (requests_per_month / 1_000_000) * 3.50  # $3.50 per million
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon API Gateway",
             description="REST API endpoint",
-            hourly_cost=api_cost / 720,
-            daily_cost=api_cost / 30,
-            monthly_cost=api_cost,
+            monthly=api_cost,
             cost_components={
                 'api_calls': api_cost
             },
@@ -342,30 +473,15 @@ class CostEstimator:
 
     def _calculate_bedrock_costs(self) -> ServiceCost:
         """Amazon Bedrock costs - SIGNIFICANT cost driver"""
-        config = self.volume_config[self.data_volume]
-
-        # Embedding costs (Titan)
-        embedding_requests = config['embedding_requests']
-        embedding_tokens = embedding_requests * 500  # avg 500 tokens per doc
-        embedding_cost = (embedding_tokens / 1000) * 0.0001  # $0.0001 per 1K tokens
-
-        # Claude generation costs
-        queries_per_month = config['rag_queries_per_day'] * 30
-        input_tokens = queries_per_month * 3000  # context + query
-        output_tokens = queries_per_month * 500  # response
-
-        # Claude 3 Sonnet pricing
-        input_cost = (input_tokens / 1000) * 0.003  # $3 per 1M input
-        output_cost = (output_tokens / 1000) * 0.015  # $15 per 1M output
-
+        embedding_cost, input_cost, output_cost = _bedrock_components(
+            self.volume.embedding_requests, self.volume.rag_queries_per_day
+        )
         monthly = embedding_cost + input_cost + output_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon Bedrock",
             description="GenAI embeddings and text generation",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'embeddings': embedding_cost,
                 'claude_input': input_cost,
@@ -393,12 +509,10 @@ class CostEstimator:
 
         monthly = ingestion_cost + storage_cost + metrics_cost + alarm_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="Amazon CloudWatch",
             description="Monitoring and logging",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'log_ingestion': ingestion_cost,
                 'log_storage': storage_cost,
@@ -418,12 +532,10 @@ class CostEstimator:
 
         monthly = secret_cost + api_cost
 
-        return ServiceCost(
+        return ServiceCost.from_monthly(
             service_name="AWS Secrets Manager",
             description="Secure credential storage",
-            hourly_cost=monthly / 720,
-            daily_cost=monthly / 30,
-            monthly_cost=monthly,
+            monthly=monthly,
             cost_components={
                 'secrets': secret_cost,
                 'api_calls': api_cost
@@ -433,79 +545,76 @@ class CostEstimator:
 
     def generate_report(self) -> str:
         """Generate comprehensive cost report"""
+        return _cached_report(self.environment, self.data_volume)
+
+    def _build_report(self) -> str:
+        """Format the cost report (uncached)"""
         costs = self.calculate_all_costs()
 
-        total_hourly = sum(c.hourly_cost for c in costs.values())
-        total_daily = sum(c.daily_cost for c in costs.values())
-        total_monthly = sum(c.monthly_cost for c in costs.values())
+        # Single pass: accumulate totals and category sums while formatting rows
+        total_hourly = total_daily = total_monthly = 0.0
+        category_totals = dict.fromkeys(_COST_CATEGORIES, 0.0)
+        rows = []
+        for key, service_cost in costs.items():
+            total_hourly += service_cost.hourly_cost
+            total_daily += service_cost.daily_cost
+            total_monthly += service_cost.monthly_cost
+            category_totals[_CATEGORY_OF[key]] += service_cost.monthly_cost
+            rows.append(_ROW(
+                name=service_cost.service_name,
+                hourly=service_cost.hourly_cost,
+                daily=service_cost.daily_cost,
+                monthly=service_cost.monthly_cost
+            ))
 
         report = []
-        report.append("=" * 80)
+        report.append(_SEP)
         report.append("HOUSING MARKET INTELLIGENCE PLATFORM - AWS COST ESTIMATE")
-        report.append("=" * 80)
-        report.append(f"\nEnvironment: {self.environment.upper()}")
+        report.append(_SEP)
+        report.append(f"\nEnvironment: {self.environment.name}")
         report.append(f"Data Volume: {self.data_volume.value.upper()}")
         report.append(f"Region: us-east-1")
         report.append("")
-        report.append("-" * 80)
-        report.append(f"{'Service':<25} {'Hourly':>12} {'Daily':>12} {'Monthly':>12}")
-        report.append("-" * 80)
-
-        for service_cost in costs.values():
-            report.append(
-                f"{service_cost.service_name:<25} "
-                f"${service_cost.hourly_cost:>10.4f} "
-                f"${service_cost.daily_cost:>10.2f} "
-                f"${service_cost.monthly_cost:>10.2f}"
-            )
-
-        report.append("-" * 80)
-        report.append(
-            f"{'TOTAL':<25} "
-            f"${total_hourly:>10.4f} "
-            f"${total_daily:>10.2f} "
-            f"${total_monthly:>10.2f}"
-        )
-        report.append("=" * 80)
+        report.append(_DIV)
+        report.append(_TABLE_HEADER)
+        report.append(_DIV)
+
+        report.extend(rows)
+
+        report.append(_DIV)
+        report.append(_ROW(name='TOTAL', hourly=total_hourly, daily=total_daily, monthly=total_monthly))
+        report.append(_SEP)
 
         # Cost breakdown by category
         report.append("\n\nCOST BREAKDOWN BY CATEGORY")
-        report.append("-" * 40)
-
-        categories = {
-            'Compute': ['glue', 'lambda', 'opensearch'],
-            'AI/ML': ['bedrock'],
-            'Storage': ['s3'],
-            'Networking': ['nat_gateway', 'vpc'],
-            'Integration': ['appflow', 'api_gateway'],
-            'Security': ['kms', 'secrets_manager'],
-            'Monitoring': ['cloudwatch']
-        }
+        report.append(_SUBDIV)
 
-        for category, services in categories.items():
-            category_cost = sum(costs[s].monthly_cost for s in services if s in costs)
-            percentage = (category_cost / total_monthly * 100) if total_monthly > 0 else 0
-            report.append(f"{category:<20} ${category_cost:>10.2f} ({percentage:>5.1f}%)")
+        inv_total = 100.0 / total_monthly if total_monthly > 0 else 0.0
+        for category, category_cost in category_totals.items():
+            report.append(_CATEGORY_ROW(category=category, cost=category_cost, percentage=category_cost * inv_total))
 
         # Cost optimization recommendations
         report.append("\n\nCOST OPTIMIZATION RECOMMENDATIONS")
-        report.append("-" * 40)
+        report.append(_SUBDIV)
 
-        if self.environment == 'dev':
+        if self.environment is Environment.DEV:
             report.append("• Consider using NAT instances instead of NAT Gateway ($0.04/hr vs $0.045/hr)")
             report.append("• Use t3.small OpenSearch for development")
             report.append("• Reduce Glue DPU hours by optimizing job efficiency")
 
-        if costs['bedrock'].monthly_cost > total_monthly * 0.3:
+        bedrock_monthly = costs['bedrock'].monthly_cost
+        opensearch_monthly = costs['opensearch'].monthly_cost
+
+        if bedrock_monthly > total_monthly * 0.3:
             report.append("• Bedrock costs are high - consider caching frequent queries")
             report.append("• Evaluate batch processing for embeddings vs real-time")
 
-        if costs['opensearch'].monthly_cost > total_monthly * 0.2:
+        if opensearch_monthly > total_monthly * 0.2:
             report.append("• Consider OpenSearch Serverless for variable workloads")
             report.append("• Optimize index mapping to reduce storage")
 
         report.append("\n\nNOTES")
-        report.append("-" * 40)
+        report.append(_SUBDIV)
         report.append("• Costs are estimates based on January 2025 pricing")
         report.append("• Actual costs may vary based on usage patterns")
         report.append("• Free tier benefits not included in calculations")
@@ -514,7 +623,22 @@ class CostEstimator:
         return "\n".join(report)
 
 
+# Results depend only on (environment, data_volume), so sweeps and repeated
+# report requests reuse the first computation
+@functools.lru_cache(maxsize=32)
+def _cached_costs(environment: Environment, data_volume: DataVolume) -> Tuple[Tuple[str, ServiceCost], ...]:
+    return tuple(CostEstimator(environment, data_volume)._calculate_services().items())
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_report(environment: Environment, data_volume: DataVolume) -> str:
+    return CostEstimator(environment, data_volume)._build_report()
+
+
 def main():
+    # Imported here so library users of the estimator don't pay for argparse
+    import argparse
+
     parser = argparse.ArgumentParser(description='AWS Cost Estimator')
     parser.add_argument('--environment', '-e', default='dev',
                         choices=['dev', 'staging', 'prod'])
@@ -14,17 +14,91 @@ Version: 1.0.0
 
 import argparse
 import boto3
+import functools
+import hashlib
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 import json
 import os
+import random
+import re
 import sys
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import subprocess
 
 
+# Upper bound on how long to wait for a stack create/update (seconds)
+STACK_WAIT_TIMEOUT = 3600
+
+# Number of concurrent artifact uploads
+UPLOAD_WORKERS = 16
+
+# Part-upload threads each multipart upload adds on top of UPLOAD_WORKERS
+UPLOAD_PART_CONCURRENCY = 20
+
+# Client configuration shared by every AWS client. In the worst case every
+# upload worker holds a connection while a multipart upload runs all its part
+# threads, so the pool covers both to avoid "Connection pool is full" churn
+BOTO_CONFIG = Config(
+    retries={'mode': 'adaptive'},
+    max_pool_connections=UPLOAD_WORKERS + UPLOAD_PART_CONCURRENCY
+)
+
+# Third-party dependencies bundled into the Lambda package
+LAMBDA_REQUIREMENTS_FILE = Path(__file__).parent / 'requirements-lambda.txt'
+
+# Lambda runtime the dependencies are built for; must match the function's
+# Runtime (python3.12, default x86_64 architecture) in main-infrastructure.yaml
+LAMBDA_PYTHON_VERSION = '3.12'
+LAMBDA_PLATFORM = 'manylinux2014_x86_64'
+
+# Installed paths that are never used at runtime and are left out of the
+# Lambda package
+LAMBDA_EXCLUDED_DIRS = {'__pycache__', 'tests', 'test'}
+LAMBDA_EXCLUDED_DIR_SUFFIXES = ('.dist-info',)
+LAMBDA_EXCLUDED_FILE_SUFFIXES = ('.pyc',)
+
+# Lambda package compression modes selectable from the CLI
+ZIP_COMPRESSION = {
+    'stored': zipfile.ZIP_STORED,
+    'deflated': zipfile.ZIP_DEFLATED
+}
+
+# Every stack status except DELETE_COMPLETE, i.e. stacks that still exist
+LIVE_STACK_STATUSES = [
+    'CREATE_IN_PROGRESS', 'CREATE_FAILED', 'CREATE_COMPLETE',
+    'ROLLBACK_IN_PROGRESS', 'ROLLBACK_FAILED', 'ROLLBACK_COMPLETE',
+    'DELETE_IN_PROGRESS', 'DELETE_FAILED',
+    'UPDATE_IN_PROGRESS', 'UPDATE_COMPLETE_CLEANUP_IN_PROGRESS', 'UPDATE_COMPLETE',
+    'UPDATE_FAILED', 'UPDATE_ROLLBACK_IN_PROGRESS', 'UPDATE_ROLLBACK_FAILED',
+    'UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS', 'UPDATE_ROLLBACK_COMPLETE',
+    'REVIEW_IN_PROGRESS',
+    'IMPORT_IN_PROGRESS', 'IMPORT_COMPLETE', 'IMPORT_ROLLBACK_IN_PROGRESS',
+    'IMPORT_ROLLBACK_FAILED', 'IMPORT_ROLLBACK_COMPLETE'
+]
+
+# Matches a template-level Transform (YAML or JSON) or an inline Fn::Transform,
+# either of which needs CAPABILITY_AUTO_EXPAND. A text scan, since the
+# CloudFormation short-form tags (!Ref, !Sub, ...) break yaml.safe_load
+TEMPLATE_TRANSFORM_PATTERN = re.compile(
+    r'^Transform\s*:|"Transform"\s*:|Fn::Transform|!Transform\b',
+    re.MULTILINE
+)
+
+# Stack statuses that end a create/update, and the subset that means success
+STACK_SUCCESS_STATUSES = {'CREATE_COMPLETE', 'UPDATE_COMPLETE'}
+STACK_TERMINAL_STATUSES = STACK_SUCCESS_STATUSES | {
+    'ROLLBACK_COMPLETE', 'ROLLBACK_FAILED',
+    'UPDATE_ROLLBACK_COMPLETE', 'UPDATE_ROLLBACK_FAILED',
+    'DELETE_COMPLETE', 'DELETE_FAILED'
+}
+
+
 class Colors:
     """ANSI color codes for terminal output"""
     HEADER = '\033[95m'
@@ -59,89 +133,202 @@ def print_info(message: str):
     print(f"{Colors.CYAN}ℹ {message}{Colors.ENDC}")
 
 
+@functools.lru_cache(maxsize=4)
+def _get_session(region: str) -> boto3.Session:
+    """Shared boto3 session for a region, so credentials are resolved once"""
+    return boto3.Session(region_name=region)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_account_id(region: str) -> str:
+    """Get AWS account ID, preferring AWS_ACCOUNT_ID over an STS round-trip"""
+    account_id = os.environ.get('AWS_ACCOUNT_ID')
+    if account_id:
+        return account_id
+    sts = _get_session(region).client('sts', config=BOTO_CONFIG)
+    return sts.get_caller_identity()['Account']
+
+
 class DeploymentConfig:
     """Deployment configuration management"""
     
     def __init__(self, environment: str, region: str = 'us-east-1'):
         self.environment = environment
         self.region = region
+        self.session = _get_session(region)
         self.project_name = 'housing-market-intel'
-        self.account_id = self._get_account_id()
         
         # Stack names
         self.main_stack_name = f'{self.project_name}-{environment}-main'
         self.appflow_stack_name = f'{self.project_name}-{environment}-appflow'
         
-        # S3 paths
-        self.artifact_bucket = f'{self.project_name}-{environment}-artifacts-{self.account_id}'
-        
         # Local paths
         self.project_root = Path(__file__).parent.parent
         self.cloudformation_dir = self.project_root / 'cloudformation'
         self.src_dir = self.project_root / 'src'
     
-    def _get_account_id(self) -> str:
-        """Get AWS account ID"""
-        sts = boto3.client('sts', region_name=self.region)
-        return sts.get_caller_identity()['Account']
+    @functools.cached_property
+    def account_id(self) -> str:
+        """AWS account ID, looked up on first use so commands that never
+        need it (status) skip the STS call"""
+        return _get_account_id(self.region)
+    
+    @property
+    def artifact_bucket(self) -> str:
+        """S3 bucket for deployment artifacts"""
+        return f'{self.project_name}-{self.environment}-artifacts-{self.account_id}'
 
 
 class ArtifactBuilder:
     """Build and package deployment artifacts"""
     
-    def __init__(self, config: DeploymentConfig):
+    def __init__(self, config: DeploymentConfig, compression: int = zipfile.ZIP_STORED):
         self.config = config
         self.build_dir = config.project_root / 'build'
+        # Kept outside build_dir so downloaded wheels survive clean_build()
+        self.pip_cache_dir = config.project_root / '.pip-cache'
+        # Storing skips a single-threaded DEFLATE pass over tens of MB of
+        # dependencies, at the cost of a larger upload
+        self.compression = compression
     
     def build_lambda_package(self, function_name: str, source_file: Path) -> Path:
         """Package Lambda function with dependencies"""
         print_info(f"Building Lambda package: {function_name}")
         
+        import shutil
+        
+        # Skip the build entirely when the handler, its requirements and the
+        # compression mode all match the existing package
+        zip_path = self.build_dir / f'{function_name}.zip'
+        zip_stamp = zip_path.with_name(zip_path.name + '.sha256')
+        requirements = (
+            LAMBDA_REQUIREMENTS_FILE.read_bytes()
+            + f'{LAMBDA_PLATFORM}-{LAMBDA_PYTHON_VERSION}'.encode()
+        )
+        package_hash = hashlib.sha256(
+            source_file.read_bytes()
+            + requirements
+            + str(self.compression).encode()
+        ).hexdigest()
+        
+        if zip_path.exists() and zip_stamp.exists() and zip_stamp.read_text() == package_hash:
+            print_info(f"Lambda package up to date: {zip_path}")
+            return zip_path
+        
         # Create build directory
         lambda_build_dir = self.build_dir / 'lambda' / function_name
-        lambda_build_dir.mkdir(parents=True, exist_ok=True)
         
-        # Install dependencies
-        requirements = [
-            'opensearch-py>=2.4.0',
-            'requests-aws4auth>=1.2.0',
-            'boto3>=1.34.0'
-        ]
+        # Install dependencies, reusing the previous install when the
+        # requirements haven't changed since it was made
+        requirements_hash = hashlib.sha256(requirements).hexdigest()
+        requirements_stamp = lambda_build_dir.with_suffix('.reqs.sha')
         
-        subprocess.run([
-            sys.executable, '-m', 'pip', 'install',
-            '--target', str(lambda_build_dir),
-            '--quiet'
-        ] + requirements, check=True)
+        if (lambda_build_dir.exists() and requirements_stamp.exists()
+                and requirements_stamp.read_text() == requirements_hash):
+            print_info("Lambda dependencies unchanged, reusing installed packages")
+        else:
+            # Drop the stamp first so an install that fails partway can't be
+            # mistaken for a complete one on a later run
+            requirements_stamp.unlink(missing_ok=True)
+            # pip --target won't replace packages already in the directory
+            if lambda_build_dir.exists():
+                shutil.rmtree(lambda_build_dir)
+            lambda_build_dir.mkdir(parents=True)
+            
+            subprocess.run(self._install_command(lambda_build_dir), check=True)
+            requirements_stamp.write_text(requirements_hash)
         
-        # Copy source file
-        import shutil
-        shutil.copy(source_file, lambda_build_dir / source_file.name)
+        # Create ZIP, writing the handler straight from src/ and the
+        # dependencies from a single walk of the install directory, pruning
+        # bytecode, package metadata and test suites along the way. The stamp
+        # is dropped and the archive built beside the old one, so a crash
+        # mid-write can never leave a truncated zip that looks up to date
+        zip_stamp.unlink(missing_ok=True)
+        tmp_zip_path = zip_path.with_name(zip_path.name + '.tmp')
+        with zipfile.ZipFile(tmp_zip_path, 'w', self.compression) as zf:
+            zf.write(source_file, arcname=source_file.name)
+            for root, dirs, files in os.walk(lambda_build_dir):
+                dirs[:] = [
+                    name for name in dirs
+                    if name not in LAMBDA_EXCLUDED_DIRS
+                    and not name.endswith(LAMBDA_EXCLUDED_DIR_SUFFIXES)
+                ]
+                for name in files:
+                    if name.endswith(LAMBDA_EXCLUDED_FILE_SUFFIXES):
+                        continue
+                    path = Path(root) / name
+                    arcname = path.relative_to(lambda_build_dir)
+                    # Older builds copied the handler into the install directory
+                    if str(arcname) != source_file.name:
+                        zf.write(path, arcname)
+        os.replace(tmp_zip_path, zip_path)
+        zip_stamp.write_text(package_hash)
         
-        # Create ZIP
-        zip_path = self.build_dir / f'{function_name}.zip'
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file in lambda_build_dir.rglob('*'):
-                if file.is_file():
-                    arcname = file.relative_to(lambda_build_dir)
-                    zf.write(file, arcname)
-        
-        print_success(f"Lambda package created: {zip_path}")
+        size_mb = os.path.getsize(zip_path) / (1024 * 1024)
+        print_success(f"Lambda package created: {zip_path} ({size_mb:.1f} MB)")
         return zip_path
     
+    def _install_command(self, target_dir: Path) -> List[str]:
+        """Command installing the Lambda requirements into target_dir, using
+        uv when it is available and falling back to pip
+        
+        Only prebuilt wheels for the Lambda runtime are accepted, whatever the
+        host platform, and no bytecode is compiled.
+        """
+        import shutil
+        uv = shutil.which('uv')
+        if uv:
+            # uv keeps its own persistent cache, separate from pip's format,
+            # and never compiles bytecode unless asked to
+            return [
+                uv, 'pip', 'install',
+                '--target', str(target_dir),
+                '--python', sys.executable,
+                '--python-platform', 'x86_64-manylinux2014',
+                '--python-version', LAMBDA_PYTHON_VERSION,
+                '--only-binary', ':all:',
+                '--quiet',
+                '-r', str(LAMBDA_REQUIREMENTS_FILE)
+            ]
+        return [
+            sys.executable, '-m', 'pip', 'install',
+            '--target', str(target_dir),
+            '--cache-dir', str(self.pip_cache_dir),
+            '--platform', LAMBDA_PLATFORM,
+            '--implementation', 'cp',
+            '--python-version', LAMBDA_PYTHON_VERSION,
+            '--only-binary=:all:',
+            '--no-compile',
+            '--quiet',
+            '-r', str(LAMBDA_REQUIREMENTS_FILE)
+        ]
+    
     def build_glue_scripts(self) -> Path:
         """Prepare Glue ETL scripts"""
         print_info("Building Glue scripts package")
         
+        import shutil
+        
+        # Rebuilt from scratch each time so scripts deleted or renamed in
+        # src/glue aren't deployed again; it's a plain copy, nothing to reuse
         glue_build_dir = self.build_dir / 'glue'
-        glue_build_dir.mkdir(parents=True, exist_ok=True)
+        if glue_build_dir.exists():
+            shutil.rmtree(glue_build_dir)
+        glue_build_dir.mkdir(parents=True)
         
         # Copy Glue scripts
         glue_src = self.config.src_dir / 'glue'
         if glue_src.exists():
-            import shutil
-            for script in glue_src.glob('*.py'):
-                shutil.copy(script, glue_build_dir / script.name)
+            # Top-level *.py files only, matching what the Glue jobs reference
+            shutil.copytree(
+                glue_src,
+                glue_build_dir,
+                dirs_exist_ok=True,
+                ignore=lambda directory, names: [
+                    name for name in names
+                    if not (name.endswith('.py') and (Path(directory) / name).is_file())
+                ]
+            )
         
         print_success(f"Glue scripts prepared: {glue_build_dir}")
         return glue_build_dir
@@ -159,7 +346,16 @@ class S3Manager:
     
     def __init__(self, config: DeploymentConfig):
         self.config = config
-        self.s3 = boto3.client('s3', region_name=config.region)
+        self.s3 = config.session.client('s3', config=BOTO_CONFIG)
+        self._pool = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
+        # Large artifacts (the Lambda bundle) go up as concurrent multipart
+        # parts; anything under the threshold is a single PUT
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=UPLOAD_PART_CONCURRENCY,
+            use_threads=True
+        )
     
     def create_artifact_bucket(self):
         """Create S3 bucket for deployment artifacts"""
@@ -188,32 +384,80 @@ class S3Manager:
         self.s3.upload_file(
             str(local_path),
             bucket,
-            s3_key
+            s3_key,
+            Config=self.transfer_config
         )
         
         s3_uri = f"s3://{bucket}/{s3_key}"
         print_success(f"Uploaded: {s3_uri}")
         return s3_uri
     
-    def upload_directory(self, local_dir: Path, s3_prefix: str):
-        """Upload entire directory to S3"""
-        for file_path in local_dir.rglob('*'):
-            if file_path.is_file():
-                s3_key = f"{s3_prefix}/{file_path.relative_to(local_dir)}"
-                self.upload_artifact(file_path, s3_key)
+    def copy_artifact(self, s3_key: str, dest_bucket: str, dest_key: str):
+        """Copy an uploaded artifact to another bucket server-side"""
+        self.s3.copy_object(
+            CopySource={'Bucket': self.config.artifact_bucket, 'Key': s3_key},
+            Bucket=dest_bucket,
+            Key=dest_key
+        )
+    
+    def object_url(self, s3_key: str) -> str:
+        """HTTPS URL of an artifact, as accepted by CloudFormation's TemplateURL"""
+        return f"https://{self.config.artifact_bucket}.s3.{self.config.region}.amazonaws.com/{s3_key}"
+    
+    def upload_directory(self, local_dir: Path, s3_prefix: str) -> List[str]:
+        """Upload entire directory to S3 (files are uploaded concurrently)"""
+        return self.upload_many(self.directory_uploads(local_dir, s3_prefix))
+    
+    def upload_many(self, uploads: List[Tuple[Path, str]]) -> List[str]:
+        """Upload (local_path, s3_key) pairs concurrently"""
+        return list(self._pool.map(lambda upload: self.upload_artifact(*upload), uploads))
+    
+    @staticmethod
+    def directory_uploads(local_dir: Path, s3_prefix: str) -> List[Tuple[Path, str]]:
+        """(local_path, s3_key) pairs for every file under a directory"""
+        return [
+            (p, f"{s3_prefix}/{p.relative_to(local_dir)}")
+            for p in local_dir.rglob('*') if p.is_file()
+        ]
 
 
 class CloudFormationDeployer:
     """CloudFormation stack deployment"""
     
-    def __init__(self, config: DeploymentConfig):
+    def __init__(self, config: DeploymentConfig, poll_delay: int = 5):
         self.config = config
-        self.cfn = boto3.client('cloudformation', region_name=config.region)
+        self.cfn = config.session.client('cloudformation', config=BOTO_CONFIG)
+        # Poll often so short stack operations are noticed promptly; the
+        # overall wait is capped at STACK_WAIT_TIMEOUT seconds
+        self.poll_delay = poll_delay
+        # Names of stacks that currently exist, loaded on first use
+        self._existing_stacks: Optional[set] = None
+    
+    def stack_exists(self, stack_name: str) -> bool:
+        """Check whether a (non-deleted) stack exists"""
+        if self._existing_stacks is None:
+            # One paged listing answers the question for every stack we deploy
+            paginator = self.cfn.get_paginator('list_stacks')
+            self._existing_stacks = {
+                summary['StackName']
+                for page in paginator.paginate(StackStatusFilter=LIVE_STACK_STATUSES)
+                for summary in page.get('StackSummaries', [])
+            }
+        return stack_name in self._existing_stacks
+    
+    @staticmethod
+    def required_capabilities(template_path: Path) -> List[str]:
+        """Capabilities a template needs, adding CAPABILITY_AUTO_EXPAND only
+        when it uses a transform"""
+        capabilities = ['CAPABILITY_NAMED_IAM']
+        if TEMPLATE_TRANSFORM_PATTERN.search(template_path.read_text()):
+            capabilities.append('CAPABILITY_AUTO_EXPAND')
+        return capabilities
     
     def deploy_stack(
         self,
         stack_name: str,
-        template_path: Path,
+        template_url: str,
         parameters: Dict[str, str],
         capabilities: List[str] = None
     ) -> bool:
@@ -221,10 +465,6 @@ class CloudFormationDeployer:
         
         print_info(f"Deploying stack: {stack_name}")
         
-        # Read template
-        with open(template_path, 'r') as f:
-            template_body = f.read()
-        
         # Format parameters
         cfn_parameters = [
             {'ParameterKey': k, 'ParameterValue': v}
@@ -234,41 +474,37 @@ class CloudFormationDeployer:
         capabilities = capabilities or ['CAPABILITY_NAMED_IAM', 'CAPABILITY_AUTO_EXPAND']
         
         try:
-            # Check if stack exists
-            try:
-                self.cfn.describe_stacks(StackName=stack_name)
-                stack_exists = True
-            except self.cfn.exceptions.ClientError:
-                stack_exists = False
-            
-            if stack_exists:
-                # Update existing stack
+            if self.stack_exists(stack_name):
+                # Update existing stack; note its existing events so only
+                # this update's events are streamed
                 print_info(f"Updating existing stack: {stack_name}")
+                seen_event_ids = self._latest_event_ids(stack_name)
                 self.cfn.update_stack(
                     StackName=stack_name,
-                    TemplateBody=template_body,
+                    TemplateURL=template_url,
                     Parameters=cfn_parameters,
                     Capabilities=capabilities
                 )
-                waiter = self.cfn.get_waiter('stack_update_complete')
             else:
                 # Create new stack
                 print_info(f"Creating new stack: {stack_name}")
+                seen_event_ids = set()
                 self.cfn.create_stack(
                     StackName=stack_name,
-                    TemplateBody=template_body,
+                    TemplateURL=template_url,
                     Parameters=cfn_parameters,
                     Capabilities=capabilities,
                     OnFailure='ROLLBACK'
                 )
-                waiter = self.cfn.get_waiter('stack_create_complete')
+                self._existing_stacks.add(stack_name)
             
             # Wait for completion
             print_info("Waiting for stack operation to complete...")
-            waiter.wait(
-                StackName=stack_name,
-                WaiterConfig={'Delay': 30, 'MaxAttempts': 60}
-            )
+            final_status = self._wait_for_stack(stack_name, seen_event_ids)
+            
+            if final_status not in STACK_SUCCESS_STATUSES:
+                print_error(f"Stack deployment failed: {stack_name} is {final_status}")
+                return False
             
             print_success(f"Stack {stack_name} deployed successfully")
             return True
@@ -282,6 +518,44 @@ class CloudFormationDeployer:
                 print_error(f"Stack deployment failed: {error_message}")
                 return False
     
+    def _latest_event_ids(self, stack_name: str) -> set:
+        """IDs of the most recent page of a stack's events"""
+        response = self.cfn.describe_stack_events(StackName=stack_name)
+        return {event['EventId'] for event in response['StackEvents']}
+    
+    def _wait_for_stack(self, stack_name: str, seen_event_ids: set) -> str:
+        """Stream new stack events until the stack reaches a terminal status,
+        and return that status"""
+        paginator = self.cfn.get_paginator('describe_stack_events')
+        deadline = time.monotonic() + STACK_WAIT_TIMEOUT
+        
+        while time.monotonic() < deadline:
+            # Jitter keeps concurrent deployers from polling in lockstep
+            time.sleep(self.poll_delay + random.uniform(0, 1))
+            
+            # Events come newest first; stop paging once we reach ones
+            # that were already shown
+            new_events = []
+            for page in paginator.paginate(StackName=stack_name):
+                page_events = page['StackEvents']
+                fresh = [e for e in page_events if e['EventId'] not in seen_event_ids]
+                new_events.extend(fresh)
+                if len(fresh) < len(page_events):
+                    break
+            
+            for event in reversed(new_events):
+                seen_event_ids.add(event['EventId'])
+                status = event['ResourceStatus']
+                reason = event.get('ResourceStatusReason', '')
+                print(f"  {event['LogicalResourceId']}: {status} {reason}".rstrip())
+                
+                if (event['ResourceType'] == 'AWS::CloudFormation::Stack'
+                        and event['LogicalResourceId'] == stack_name
+                        and status in STACK_TERMINAL_STATUSES):
+                    return status
+        
+        raise TimeoutError(f"Timed out after {STACK_WAIT_TIMEOUT}s waiting for stack {stack_name}")
+    
     def get_stack_outputs(self, stack_name: str) -> Dict[str, str]:
         """Get outputs from deployed stack"""
         try:
@@ -292,25 +566,31 @@ class CloudFormationDeployer:
             print_warning(f"Could not get stack outputs: {str(e)}")
             return {}
     
-    def get_stack_status(self, stack_name: str) -> Optional[str]:
-        """Get current stack status"""
-        try:
-            response = self.cfn.describe_stacks(StackName=stack_name)
-            return response['Stacks'][0]['StackStatus']
-        except self.cfn.exceptions.ClientError:
-            return None
+    def list_all_stack_statuses(self) -> Dict[str, str]:
+        """Get the status of every (non-deleted) stack in one paged call"""
+        paginator = self.cfn.get_paginator('describe_stacks')
+        return {
+            stack['StackName']: stack['StackStatus']
+            for page in paginator.paginate()
+            for stack in page.get('Stacks', [])
+        }
 
 
 class HousingMarketDeployer:
     """Main deployment orchestrator"""
     
-    def __init__(self, environment: str, region: str = 'us-east-1'):
+    def __init__(
+        self,
+        environment: str,
+        region: str = 'us-east-1',
+        compression: int = zipfile.ZIP_STORED
+    ):
         self.config = DeploymentConfig(environment, region)
-        self.builder = ArtifactBuilder(self.config)
+        self.builder = ArtifactBuilder(self.config, compression=compression)
         self.s3 = S3Manager(self.config)
         self.cfn = CloudFormationDeployer(self.config)
     
-    def deploy(self, skip_confirmation: bool = False):
+    def deploy(self, skip_confirmation: bool = False, clean: bool = False):
         """Execute full deployment"""
         
         print_header(f"HOUSING MARKET INTELLIGENCE PLATFORM DEPLOYMENT")
@@ -328,7 +608,8 @@ class HousingMarketDeployer:
         try:
             # Phase 1: Build Artifacts
             print_header("PHASE 1: Building Artifacts")
-            self.builder.clean_build()
+            if clean:
+                self.builder.clean_build()
             
             lambda_zip = self.builder.build_lambda_package(
                 'rag-query-handler',
@@ -343,30 +624,31 @@ class HousingMarketDeployer:
             
             timestamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
             
-            self.s3.upload_artifact(
-                lambda_zip,
-                f'lambda/rag_query_handler-{timestamp}.zip'
-            )
-            
-            self.s3.upload_directory(glue_dir, 'glue/scripts')
+            # The Lambda package, Glue scripts and CloudFormation templates
+            # are independent, so upload them all as one concurrent batch
+            lambda_key = f'lambda/rag_query_handler-{timestamp}.zip'
+            glue_uploads = self.s3.directory_uploads(glue_dir, 'glue/scripts')
             
-            # Upload CloudFormation templates
-            for template in self.config.cloudformation_dir.glob('*.yaml'):
-                self.s3.upload_artifact(
-                    template,
-                    f'cloudformation/{template.name}'
-                )
+            uploads = [(lambda_zip, lambda_key)] + glue_uploads
+            uploads += [
+                (template, f'cloudformation/{template.name}')
+                for template in self.config.cloudformation_dir.glob('*.yaml')
+            ]
+            self.s3.upload_many(uploads)
             
             # Phase 3: Deploy Main Infrastructure
             print_header("PHASE 3: Deploying Main Infrastructure")
             
             main_success = self.cfn.deploy_stack(
                 stack_name=self.config.main_stack_name,
-                template_path=self.config.cloudformation_dir / 'main-infrastructure.yaml',
+                template_url=self.s3.object_url('cloudformation/main-infrastructure.yaml'),
                 parameters={
                     'Environment': self.config.environment,
                     'ProjectName': self.config.project_name
-                }
+                },
+                capabilities=self.cfn.required_capabilities(
+                    self.config.cloudformation_dir / 'main-infrastructure.yaml'
+                )
             )
             
             if not main_success:
@@ -381,20 +663,23 @@ class HousingMarketDeployer:
             
             appflow_success = self.cfn.deploy_stack(
                 stack_name=self.config.appflow_stack_name,
-                template_path=self.config.cloudformation_dir / 'appflow-data-ingestion.yaml',
+                template_url=self.s3.object_url('cloudformation/appflow-data-ingestion.yaml'),
                 parameters={
                     'Environment': self.config.environment,
                     'ProjectName': self.config.project_name,
                     'RawDataBucketName': main_outputs.get('RawDataBucketName', ''),
                     'KMSKeyArn': main_outputs.get('KMSKeyArn', '')
-                }
+                },
+                capabilities=self.cfn.required_capabilities(
+                    self.config.cloudformation_dir / 'appflow-data-ingestion.yaml'
+                )
             )
             
             # Phase 5: Post-Deployment Configuration
             print_header("PHASE 5: Post-Deployment Configuration")
             
-            self._upload_glue_scripts_to_bucket(main_outputs)
-            self._upload_lambda_code_to_bucket(main_outputs, lambda_zip)
+            self._copy_glue_scripts_to_bucket(main_outputs, glue_uploads)
+            self._copy_lambda_code_to_bucket(main_outputs, lambda_key)
             
             # Print summary
             print_header("DEPLOYMENT COMPLETE")
@@ -404,31 +689,22 @@ class HousingMarketDeployer:
             print_error(f"Deployment failed: {str(e)}")
             raise
     
-    def _upload_glue_scripts_to_bucket(self, outputs: Dict[str, str]):
-        """Upload Glue scripts to the scripts bucket"""
+    def _copy_glue_scripts_to_bucket(self, outputs: Dict[str, str], glue_uploads: List[Tuple[Path, str]]):
+        """Copy the Glue scripts uploaded in Phase 2 to the scripts bucket"""
         scripts_bucket = outputs.get('ProcessedDataBucketName', '').replace('processed', 'glue-scripts')
         if scripts_bucket:
-            glue_dir = self.builder.build_dir / 'glue'
-            if glue_dir.exists():
-                for script in glue_dir.glob('*.py'):
-                    self.s3.s3.upload_file(
-                        str(script),
-                        scripts_bucket.split('/')[-1] if '/' in scripts_bucket else scripts_bucket,
-                        f'scripts/{script.name}'
-                    )
-                print_success("Glue scripts uploaded to scripts bucket")
-    
-    def _upload_lambda_code_to_bucket(self, outputs: Dict[str, str], lambda_zip: Path):
-        """Upload Lambda code to deployment bucket"""
+            bucket_name = scripts_bucket.split('/')[-1] if '/' in scripts_bucket else scripts_bucket
+            for script, source_key in glue_uploads:
+                self.s3.copy_artifact(source_key, bucket_name, f'scripts/{script.name}')
+            print_success("Glue scripts copied to scripts bucket")
+    
+    def _copy_lambda_code_to_bucket(self, outputs: Dict[str, str], lambda_key: str):
+        """Copy the Lambda package uploaded in Phase 2 to the deployment bucket"""
         scripts_bucket = outputs.get('ProcessedDataBucketName', '').replace('processed', 'glue-scripts')
         if scripts_bucket:
             bucket_name = scripts_bucket.split('/')[-1] if '/' in scripts_bucket else scripts_bucket
-            self.s3.s3.upload_file(
-                str(lambda_zip),
-                bucket_name,
-                'lambda/rag_query_handler.zip'
-            )
-            print_success("Lambda code uploaded")
+            self.s3.copy_artifact(lambda_key, bucket_name, 'lambda/rag_query_handler.zip')
+            print_success("Lambda code copied")
     
     def _print_summary(self, outputs: Dict[str, str]):
         """Print deployment summary"""
@@ -454,8 +730,10 @@ class HousingMarketDeployer:
             self.config.appflow_stack_name
         ]
         
+        statuses = self.cfn.list_all_stack_statuses()
+        
         for stack_name in stacks:
-            status = self.cfn.get_stack_status(stack_name)
+            status = statuses.get(stack_name)
             if status:
                 color = Colors.GREEN if 'COMPLETE' in status else Colors.WARNING
                 print(f"  {stack_name}: {color}{status}{Colors.ENDC}")
@@ -489,16 +767,28 @@ def main():
         action='store_true',
         help='Skip deployment confirmation'
     )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help='Remove the build directory and rebuild all artifacts'
+    )
+    parser.add_argument(
+        '--compression',
+        default='stored',
+        choices=sorted(ZIP_COMPRESSION),
+        help='Lambda package compression (deflated gives a smaller upload)'
+    )
     
     args = parser.parse_args()
     
     deployer = HousingMarketDeployer(
         environment=args.environment,
-        region=args.region
+        region=args.region,
+        compression=ZIP_COMPRESSION[args.compression]
     )
     
     if args.action == 'deploy':
-        deployer.deploy(skip_confirmation=args.skip_confirmation)
+        deployer.deploy(skip_confirmation=args.skip_confirmation, clean=args.clean)
     elif args.action == 'status':
         deployer.status()
 